@@ -0,0 +1,540 @@
+"""
+Файл с методом парсинга данных о солнечных индексах для модели атмосферы JB2006
+"""
+import requests
+from requests.adapters import HTTPAdapter
+
+from datetime import datetime, timedelta
+from email.utils import formatdate, parsedate_to_datetime
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional
+
+import os
+import tempfile
+
+# сумма весовых коэффициентов W(i) = 1 + ((0.5 * i) / 80) для i от -80 до -1 - не меняется, поэтому считаем её один раз
+_WEIGHTS_SUM = sum(1 + (0.5 * i) / 80 for i in range(-80, 0))
+
+# задержка, с которой публикуются индексы JB2008, и один день
+_INDICES_DELAY = timedelta(days=45)
+_ONE_DAY = timedelta(days=1)
+
+# общая сессия для всех загрузок: соединения с одним и тем же сервером переиспользуются (без повторного TLS),
+# а размер пула совпадает с числом одновременно скачиваемых файлов
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=3))
+_SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=3))
+
+
+def convert_calendar_to_mjd(current_line_flux: List[str]) -> str:
+    """
+    Данная функция переводит дату из формата календаря (см. далее) в mjd:
+
+                            Y M D -> mjd,
+
+    где Y - текущий год, M - текущий месяц года, а D - текущей день месяца этого года
+    :param current_line_flux: список с текущей датой и значениями индексов на текущую дату
+    :return: mjd-время для данной даты (в виде строки)
+    """
+    # берём год, месяц и день из начала списка
+    year = int(current_line_flux[0])
+    month = int(current_line_flux[1])
+    day = int(current_line_flux[2])
+    # считаем mjd по целочисленной формуле перевода календарной даты (верна для 1900 - 2100 годов):
+    #       mjd = 367 * Y - 7 * (Y + (M + 9) / 12) / 4 + 275 * M / 9 + D - 678987
+    mjd = 367 * year - (7 * (year + (month + 9) // 12)) // 4 + (275 * month) // 9 + day - 678987
+    return str(float(mjd))
+
+
+def convert_MG2_to_M10(mgii: float) -> str:
+    """
+    Данная функция конвертирует индекс MG2 в M10 по следующим формулам:
+
+        M10 = -1943.85 + 7606.56 * MG2
+
+    :param mgii: индекс MG2
+    :return: индекс M10 (в виде строки)
+    """
+    M10 = -1943.85 + 7606.56 * mgii
+    if M10 > 0:
+        return str(round(M10, 1))
+    else:
+        return '0'
+
+
+class WeightedWindow:
+    """
+    Данный класс хранит 80 последних значений индекса (от самого старого к самому новому) и считает по ним
+    взвешенное среднее (см. make_S10B) за O(1), а не заново суммируя все 80 слагаемых каждый день.
+
+    Если пронумеровать значения окна j = 0, ..., 79 от самого старого, то W(j) = 0.5 + j / 160, откуда:
+
+                    Σ X(j) * W(j) = 0.5 * Σ X(j) + (Σ j * X(j)) / 160,
+
+    а обе суммы в правой части обновляются при сдвиге окна на один день за несколько операций
+    """
+
+    def __init__(self, values: Iterable[float]):
+        """
+        :param values: начальные значения индекса (от самого старого к самому новому)
+        """
+        self.values = deque(maxlen=80)
+        # Σ X(j) и Σ j * X(j) по значениям окна
+        self.sum = 0.0
+        self.index_sum = 0.0
+        for value in values:
+            self.append(value)
+
+    def append(self, value: float) -> None:
+        """
+        Данный метод добавляет в окно новое значение, вытесняя самое старое, если окно уже заполнено
+        :param value: новое значение индекса
+        :return: ---
+        """
+        if len(self.values) == self.values.maxlen:
+            # при сдвиге номер каждого оставшегося значения уменьшается на 1, самое старое (j = 0) уходит,
+            # а новое получает номер 79
+            oldest = self.values[0]
+            self.index_sum += oldest - self.sum + (self.values.maxlen - 1) * value
+            self.sum += value - oldest
+        else:
+            self.index_sum += len(self.values) * value
+            self.sum += value
+        self.values.append(value)
+
+    def mean(self) -> str:
+        """
+        Данный метод вычисляет взвешенное среднее по значениям окна:
+
+                    (Σ X(i) * W(i)) / (Σ W(i)),
+
+        где i принимает значения от -80 до -1, а W(i) = 1 + ((0.5 * i) / 80)
+
+        :return: значение взвешенного среднего на текущую дату (в виде строки)
+        """
+        # веса W(i) заданы ровно для 80 значений - по неполному окну среднее получилось бы неверным
+        if len(self.values) < self.values.maxlen:
+            raise Exception("Для вычисления S10B и XM10B нужны данные минимум за 80 предыдущих дней, а есть только за: "
+                            + str(len(self.values)))
+        return str(round((0.5 * self.sum + self.index_sum / 160) / _WEIGHTS_SUM, 1))
+
+
+def make_S10B(s10_history: WeightedWindow) -> str:
+    """
+    Данная функция вычисляет индекс S10B, зная все 81 прошлые индексы S10, по формуле:
+
+                    S10B = (Σ S10(i) * W(i)) / (Σ W(i)),
+
+    где i принимает значения от -80 до 0, а W(i) - весовой коэффициент для данного i, вычисляемый по формуле:
+
+                    W(i) = 1 + ((0.5 * i) / 80)
+
+    :param s10_history: 80 прошлых значений индекса S10 (без текущего)
+    :return: значение индекса S10B на последнюю дату (в виде строки)
+    """
+    return s10_history.mean()
+
+
+def make_XM10B(xm10_history: WeightedWindow) -> str:
+    """
+    Данная функция вычисляет индекс XM10B, зная все 81 прошлые индексы XM10, по формуле:
+
+                    XM10B = (Σ XM10(i) * W(i)) / (Σ W(i)),
+
+    где i принимает значения от -80 до 0, а W(i) - весовой коэффициент для данного i, вычисляемый по формуле:
+
+                    W(i) = 1 + ((0.5 * i) / 80)
+
+    :param xm10_history: 80 прошлых значений индекса XM10 (без текущего)
+    :return: значение индекса XM10B на последнюю дату (в виде строки)
+    """
+    return xm10_history.mean()
+
+
+def convert_MG2_to_S10(mgii: float) -> str:
+    """
+    Данная функция конвертирует индекс MG2 в S10 по следующим формулам:
+
+    1) Сначала - из MG2 в EUV-излучение:
+
+            EUV = 110.324 * mgii - 28.065
+
+    2) Затем - из EUV-излучения в S10:
+
+            S10 = -12.01 + 141.23 * (EUV / 1.9955)
+
+    :param mgii: индекс MG2
+    :return: индекс S10 (в виде строки)
+    """
+    EUV = 110.324 * mgii - 28.065
+    S10 = -12.01 + 141.23 * (EUV / 1.9955)
+    if S10 > 0:
+        return str(round(S10, 1))
+    else:
+        return '0'
+
+
+def make_indices_for_day(date: List[str], mgii: float, s10_history: WeightedWindow,
+                         xm10_history: WeightedWindow) -> List[str]:
+    """
+    Данная функция за один вызов считает все индексы, получаемые из MG2, на текущую дату:
+
+        MJD --- S10 --- S10B --- XM10 --- XM10B
+
+    и сдвигает окна истории S10 и XM10 на один день (добавляет в них текущие значения)
+    :param date: список из года, месяца и дня текущей даты
+    :param mgii: индекс MG2 на текущую дату
+    :param s10_history: 80 прошлых значений индекса S10
+    :param xm10_history: 80 прошлых значений индекса XM10
+    :return: список со значениями mjd и индексов на текущую дату (в виде строк)
+    """
+    S10 = convert_MG2_to_S10(mgii)
+    M10 = convert_MG2_to_M10(mgii)
+    # взвешенные средние считаем по прошлым значениям, без текущего
+    S10B = make_S10B(s10_history)
+    XM10B = make_XM10B(xm10_history)
+    s10_history.append(float(S10))
+    xm10_history.append(float(M10))
+    return [convert_calendar_to_mjd(date), S10, S10B, M10, XM10B]
+
+
+def make_csv_rows(array: List[List[str]]) -> List[str]:
+    """
+    Данная функция делает из массива индексов строки для csv-файла,
+    содержащие данные о всех индексах солнечной и геомагнитной активности в порядке:
+
+        MJD --- AP1 --- AP2 --- AP3 --- AP4 --- AP5 --- AP6 --- AP7 --- AP8 --- F10 --- F81 --- S10 --- S10B --- XM10 --- XM10B
+
+    Столбцы массива переводятся в строки за один проход zip, без обращения к каждому столбцу по номеру дня
+    :param array: массив со всеми данными и датами
+    :return: список строк для csv-файла (с переводом строки в конце каждой)
+    """
+    return [','.join((mjd, *ap, *indices)) + '\n' for mjd, ap, indices in zip(array[0], array[-1], zip(*array[1:-1]))]
+
+
+def create_data_for_res_file(current_line_flux: List[str], current_line_magnitude: List[str]) -> str:
+    """
+    Данная функция по данным за год делает строку, содержащую данные о всех индексах солнечной и геомагнитной активности в порядке:
+
+        MJD --- AP1 --- AP2 --- AP3 --- AP4 --- AP5 --- AP6 --- AP7 --- AP8 --- F10 --- F81 --- S10 --- S10B --- XM10 --- XM10B
+
+    :param current_line_flux: конкретная строка в файле SOLFSMY.TXT (данные о солнечной активности)
+    :param current_line_magnitude: конкретная строка в файле SOLRESAP.TXT (данные о геомагнитной активности)
+    :return: строка со всеми нужными индексами и датой их получения (с переводом строки в конце)
+    """
+    return ','.join((str(float(current_line_flux[2]) - 2400000.5),
+                     current_line_magnitude[3], current_line_magnitude[4], current_line_magnitude[5],
+                     current_line_magnitude[6], current_line_magnitude[7], current_line_magnitude[8],
+                     current_line_magnitude[9], current_line_magnitude[10],
+                     current_line_flux[3], current_line_flux[4], current_line_flux[5],
+                     current_line_flux[6], current_line_flux[7], current_line_flux[8])) + '\n'
+
+
+def read_lines(file_name: str) -> List[str]:
+    """
+    Данная функция читает файл с индексами целиком, одним вызовом read, и разбивает его на строки
+    :param file_name: путь к файлу
+    :return: список строк файла (без символов перевода строки)
+    """
+    with open(file_name, 'r', encoding='utf-8') as file:
+        return file.read().splitlines()
+
+
+def make_indices_array_before_45_days(start_date: datetime, end_date: datetime, csv_rows: Optional[List[str]] = None,
+                                      data_dir: str = os.curdir) -> List[List[str]]:
+    """
+    Данная функция делает массив данных о всех индексах для диапазана дат:
+
+                    [start_date; end_date - 45 days]
+
+    Если передан список для строк csv-файла, то готовые строки с индексами сразу добавляются в него, а в массиве
+    остаются только последние 80 дней - они нужны для вычисления S10B и XM10B следующих дней
+    :param: start_date: начальная дата
+    :param: end_date: конечная дата
+    :param: csv_rows: список, в который добавляются строки csv-файла (по умолчанию - нет, данные собираются в массив)
+    :param: data_dir: папка со скачанными файлами SOLFSMY.TXT и SOLRESAP.TXT (по умолчанию - текущая)
+    :return: массив с данными о индексах за указанный диапазон дат
+    """
+    result_mjd = []
+    result_F10 = []
+    result_F10B = []
+    result_S10 = []
+    result_S10B = []
+    result_XM10 = []
+    result_XM10B = []
+    result_AP = []
+    try:
+        # читаем оба файла целиком за один раз - дальше нужные строки просто берём по номеру
+        SOLFSMY_lines = read_lines(os.path.join(data_dir, "SOLFSMY.TXT"))
+        SOLRESAP_lines = read_lines(os.path.join(data_dir, "SOLRESAP.TXT"))
+
+        # пропускаем первые 4 строки в обоих файлах - там просто информация о времени измерения индексов;
+        # пропускаем далее ещё 23 строки в файле с геомагнитными индексами для согласования времён с солнечными
+        # (тут они приведены на год раньше, чтобы не возникло конфликтов с данными, сами убираем этот кусок)
+        SOLFSMY_offset = 4
+        SOLRESAP_offset = 4 + 23
+
+        # выделяем дату - 1 января 1997 года - как год "рождения" обоих типов индексов
+        index_birth_date = datetime(year=int(SOLFSMY_lines[SOLFSMY_offset][2:6]), month=1, day=1)
+        # выделяем дату - последний день, за который уже есть данные (вчера)
+        index_last_date = datetime.today() - _ONE_DAY
+        # проверяем введённую дату на принадлежность: [рождение; сейчас]
+        # если не принадлежит - выбрасываем исключение
+        if start_date < index_birth_date or end_date > index_last_date:
+            raise Exception(
+                "Даты не попадают в допустимый диапазон от: " + str(index_birth_date) + " до: " + str(
+                    index_last_date))
+        # если введённая начальная дата больше конечной, то выбрасываем исключение
+        if start_date > end_date:
+            raise Exception("Начальная дата больше конечной")
+
+        # ищем количество дней между датой "рождения" и введённой начальной датой
+        start_date_delta = (start_date - index_birth_date).days
+        # ищем число шагов до конца нашего введённого промежутка дат
+        end_date_delta = (end_date - start_date).days
+
+        # зная количество дней между рождением и начальной, сразу берём нужный кусок строк из обоих файлов
+        flux_lines = SOLFSMY_lines[SOLFSMY_offset + start_date_delta:
+                                   SOLFSMY_offset + start_date_delta + end_date_delta]
+        magnitude_lines = SOLRESAP_lines[SOLRESAP_offset + start_date_delta:
+                                         SOLRESAP_offset + start_date_delta + end_date_delta]
+
+        # если собираем строки csv-файла, то в массив раскладываем только последние 80 дней
+        if csv_rows is not None:
+            csv_rows.extend([create_data_for_res_file(current_line_flux, current_line_magnitude)
+                             for current_line_flux, current_line_magnitude in zip(map(str.split, flux_lines),
+                                                                                  map(str.split, magnitude_lines))])
+            flux_lines = flux_lines[-80:]
+            magnitude_lines = magnitude_lines[-80:]
+        # итерируемся и каждый раз записываем данные
+        # строки разбиваются на значения через map, без отдельного вызова split в теле цикла
+        for current_line_flux, current_line_magnitude in zip(map(str.split, flux_lines),
+                                                             map(str.split, magnitude_lines)):
+            # раскладываем значения сразу по столбцам, без промежуточной строки
+            result_mjd.append(str(float(current_line_flux[2]) - 2400000.5))
+            result_F10.append(current_line_flux[3])
+            result_F10B.append(current_line_flux[4])
+            result_S10.append(current_line_flux[5])
+            result_S10B.append(current_line_flux[6])
+            result_XM10.append(current_line_flux[7])
+            result_XM10B.append(current_line_flux[8])
+            result_AP.append(current_line_magnitude[3:11])
+    except FileNotFoundError:
+        print("Хотя бы одного файла нет!")
+    # формируем выходной массив данных
+    return [result_mjd, result_F10, result_F10B, result_S10, result_S10B, result_XM10, result_XM10B, result_AP]
+
+
+def update_indices_array_after_45_days(array: List[List[str]], start_date: datetime, end_date: datetime,
+                                       data_dir: str = os.curdir) -> None:
+    # S10B и XM10B для новых дней считаются по 80 предыдущим дням - проверяем это до чтения файлов
+    if len(array[3]) < 80:
+        raise Exception("Для вычисления S10B и XM10B нужны данные минимум за 80 предыдущих дней, а есть только за: "
+                        + str(len(array[3])))
+    try:
+        # читаем оба файла целиком, пропуская первые 17 строк в файле celestrak'а
+        celestrak_lines = read_lines(os.path.join(data_dir, "CELESTRAK.TXT"))[17:]
+        mgii_lines = read_lines(os.path.join(data_dir, "MGII.TXT"))
+
+        # даты в обоих файлах записаны в фиксированном формате 'YYYY MM DD'
+        start_key = start_date.strftime('%Y %m %d')
+        end_key = end_date.strftime('%Y %m %d')
+        # в celestrak'е идёт по строке на каждый день, поэтому номера строк с нужными датами
+        # считаем сразу от первой даты файла, без прохода по нему
+        celestrak_first_date = datetime.strptime(celestrak_lines[0][0:10], '%Y %m %d')
+        start_row = (start_date - celestrak_first_date).days
+        end_row = (end_date - celestrak_first_date).days
+        if not 0 <= start_row < len(celestrak_lines) or celestrak_lines[start_row][0:10] != start_key:
+            raise Exception("В файле CELESTRAK.TXT нет даты: " + start_key)
+        if not 0 <= end_row < len(celestrak_lines) or celestrak_lines[end_row][0:10] != end_key:
+            raise Exception("В файле CELESTRAK.TXT нет даты: " + end_key)
+        # ищем нужную дату в mgii'е, с которой начнём взятие данных
+        mgii_dates = [line[1:5] + " " + line[13:18] for line in mgii_lines]
+        try:
+            mgii_start_row = mgii_dates.index(start_key)
+        except ValueError:
+            raise Exception("В файле MGII.TXT нет даты: " + start_key)
+        # строки celestrak'а и mgii'а идут парами, поэтому в mgii'е должны быть все те же даты подряд, без пропусков
+        days_count = end_row - start_row
+        mgii_days_count = len(mgii_lines) - mgii_start_row
+        if mgii_days_count < days_count:
+            raise Exception("В файле MGII.TXT нет даты: " + celestrak_lines[start_row + mgii_days_count][0:10])
+        for k in range(days_count):
+            if mgii_dates[mgii_start_row + k] != celestrak_lines[start_row + k][0:10]:
+                raise Exception("В файле MGII.TXT нет даты: " + celestrak_lines[start_row + k][0:10])
+
+        # последние 80 значений S10 и XM10 храним в скользящих окнах, чтобы S10B и XM10B считались за O(1) в день
+        s10_history = WeightedWindow(map(float, array[3][-80:]))
+        xm10_history = WeightedWindow(map(float, array[5][-80:]))
+        # двигаемся по файлам celestrak и mgii, добавляя значения mjd и индексов F10, F10B, Ap1-Ap8
+        # индексы же S10, S10B, XM10, XM10B получаем за один вызов make_indices_for_day (см. выше)
+        for current_celestrak_line, current_mgii_line in zip(celestrak_lines[start_row:end_row],
+                                                             mgii_lines[mgii_start_row:mgii_start_row + days_count]):
+            tmp_list = current_celestrak_line.split()
+            MG2 = current_mgii_line.split()[-1]
+            mjd, S10, S10B, M10, XM10B = make_indices_for_day(tmp_list[0:3], float(MG2), s10_history,
+                                                              xm10_history)
+            array[0].append(mjd)
+            array[1].append(tmp_list[26])
+            array[2].append(tmp_list[28])
+            array[3].append(S10)
+            array[4].append(S10B)
+            array[5].append(M10)
+            array[6].append(XM10B)
+            array[7].append(
+                [tmp_list[14], tmp_list[15], tmp_list[16], tmp_list[17], tmp_list[18], tmp_list[19], tmp_list[20],
+                 tmp_list[21]])
+
+    except FileNotFoundError:
+        print("Один из файлов не был найден!")
+
+
+def make_csv_for_JB2006(start_date: datetime, end_date: datetime, data_dir: str = os.curdir,
+                        csv_name: str = 'jachnia_lala.csv') -> None:
+    """
+    Данная функция делает csv-file, содержащий все нужные входные данные для модели атмосферы JB2006.
+    Если для последних 45 дней в CELESTRAK.TXT или MGII.TXT нет хотя бы одной даты (в том числе при пропуске
+    одного дня в MGII.TXT), или до них меньше 80 дней данных, то выбрасывается исключение, а файл не записывается
+    (раньше в таком случае файл мог получиться с неполными данными)
+    :param start_date: начальная дата в формате datetime, с которой начнётся извлечение информации о индексах
+    :param end_date: конечная дата в формате datetime, до которой будет продолжаться извлечение информации о индексах
+    :param data_dir: папка со скачанными файлами индексов (по умолчанию - текущая)
+    :param csv_name: название файла (по умолчанию = 'jachnia_lala.csv'), в который будет записана информация в виде таблицы
+    :return: ---
+    """
+    csv_rows = []
+    # если введённая дата <= сегодняшней с оставанием в 45 дней, то просто берём данные с сайта JB2008/indices
+    if end_date <= datetime.today() - _INDICES_DELAY:
+        # здесь S10B и XM10B пересчитывать не нужно, поэтому строки csv-файла собираются прямо при чтении
+        # исходных данных
+        make_indices_array_before_45_days(start_date, end_date, csv_rows, data_dir)
+
+    else:
+        end_date = end_date - _INDICES_DELAY
+        # строки до end_date - 45 days тоже собираются сразу при чтении, а в массиве остаются только
+        # последние 80 дней - по ним досчитываются S10B и XM10B для оставшихся дней
+        tmp = make_indices_array_before_45_days(start_date, end_date, csv_rows, data_dir)
+        backfill_days = len(tmp[0])
+        update_indices_array_after_45_days(tmp, end_date - _INDICES_DELAY, end_date, data_dir)
+        csv_rows.extend(make_csv_rows([column[backfill_days:] for column in tmp]))
+
+    # файл открываем, только когда все строки готовы: при ошибке в данных прошлый результат не затирается,
+    # а недописанный файл не остаётся
+    try:
+        with open(csv_name, 'w') as file:
+            file.write('mjd,ap1,ap2,ap3,ap4,ap5,ap6,ap7,ap8,F10,F81,S10,S10B,XM10,XM10B\n')
+            # записываем все строки одним вызовом write
+            file.write(''.join(csv_rows))
+    except FileNotFoundError:
+        print("Файл не был найден!")
+
+
+def download_file(url: str, file_name: str) -> None:
+    """
+    Данная функция скачивает файл по ссылке и записывает его под данным именем.
+    Если файл уже был скачан ранее, то серверу отправляется заголовок If-Modified-Since со временем его изменения,
+    и при ответе 304 (файл на сервере не изменился) повторная загрузка не делается
+    :param url: ссылка на файл
+    :param file_name: путь к файлу, в который будет записано содержимое
+    :return: ---
+    """
+    headers = {}
+    if os.path.exists(file_name):
+        headers['If-Modified-Since'] = formatdate(os.path.getmtime(file_name), usegmt=True)
+    response = _SESSION.get(url, headers=headers, timeout=30)
+    # файл на сервере не изменился - оставляем уже скачанный
+    if response.status_code == 304:
+        return
+    # при ошибке сервера (404, 500, ...) не работаем молча со старыми данными, а выбрасываем исключение
+    response.raise_for_status()
+    # пишем во временный файл рядом и только потом подменяем им старый: если запись прервётся, то на месте
+    # останется прошлая целая версия, а не обрезанный файл со свежим временем изменения
+    tmp_fd, tmp_name = tempfile.mkstemp(dir=os.path.dirname(file_name) or os.curdir,
+                                        prefix=os.path.basename(file_name) + '.')
+    try:
+        with os.fdopen(tmp_fd, 'wb') as file:
+            file.write(response.content)
+        # ставим файлу время изменения с сервера, чтобы при следующем запросе сравнение шло с ним;
+        # если заголовок не разобрать, то остаётся локальное время записи
+        last_modified = response.headers.get('Last-Modified')
+        if last_modified is not None:
+            try:
+                timestamp = parsedate_to_datetime(last_modified).timestamp()
+            except (ValueError, TypeError):
+                pass
+            else:
+                os.utime(tmp_name, (timestamp, timestamp))
+        os.replace(tmp_name, file_name)
+    except BaseException:
+        os.remove(tmp_name)
+        raise
+
+
+def parse_all_files(url_celestrak: str, url_iup_mgii: str, url_JB2008_flux: str, url_JB2008_magnit: str,
+                    data_dir: str = os.curdir) -> None:
+    """
+    Данная функция по данным ссылкам на соответствующие файлы получаем их содержимое:
+
+        1) 'SOLFSMY.TXT' - данные о солнечной излучении для [start_date; end_date - 45 days]
+        2) 'SOLRESAP.TXT' - данные о геомагнитной активности для [start_date; end_date - 45 days]
+        3) 'SW-Last5Years.txt' - данные о солнечном излучении для [end_date - 45 days; end_date]
+        4) 'GOME2B_Index_classic.dat' - данные о геомагнитной активности для [end_date - 45 days; end_date]
+
+    :param url_celestrak: ссылка на файл 1)
+    :param url_iup_mgii: ссылка на файл 2)
+    :param url_JB2008_flux: ссылка на файл 3)
+    :param url_JB2008_magnit: ссылка на файл 4)
+    :param data_dir: папка, в которую будут записаны файлы (по умолчанию - текущая)
+    :return: ---
+    """
+    # файлы независимы друг от друга, поэтому скачиваем их одновременно - общее время равно самой долгой загрузке
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(download_file, url_celestrak, os.path.join(data_dir, "CELESTRAK.TXT")),
+                   executor.submit(download_file, url_iup_mgii, os.path.join(data_dir, "MGII.TXT")),
+                   executor.submit(download_file, url_JB2008_flux, os.path.join(data_dir, "SOLFSMY.TXT")),
+                   executor.submit(download_file, url_JB2008_magnit, os.path.join(data_dir, "SOLRESAP.TXT"))]
+        for future in futures:
+            future.result()
+
+
+def get_csv_file(start_date: datetime, end_date: datetime, data_dir: Optional[str] = None,
+                 csv_name: str = 'jachnia_lala.csv') -> None:
+    """
+    Данная функция отдаёт csv-file, содержащий входные данные о индексах для модели атмосферы JB2006.
+    Если в скачанных данных за последние 45 дней есть пропуск хотя бы одной даты, то выбрасывается исключение,
+    а csv-file не записывается (см. make_csv_for_JB2006)
+    :param start_date: начальная дата в формате datetime
+    :param end_date: конечная дата в формате datetime
+    :param data_dir: папка для хранения скачанных файлов между запусками (по умолчанию - нет, файлы скачиваются
+    во временную папку, которая удаляется после работы)
+    :param csv_name: название файла (по умолчанию = 'jachnia_lala.csv'), в который будет записана информация в виде таблицы
+    :return: ---
+    """
+    # наша url страницы c индексами JB2008 (F10, F10B, S10, S10B, XM10, XM10B), которые будем брать для диапазона дат:
+    # [start_date, end_date - 45], где 45 дней - задержка, с которой публикуются все индексы на данном сайте
+    url_flux = 'https://sol.spacenvironment.net/jb2008/indices/SOLFSMY.TXT'
+    url_magnit = 'https://sol.spacenvironment.net/jb2008/indices/SOLRESAP.TXT'
+
+    # отсюда берем индексы солчнего излучения (F10, F10B) для диапазона дат:
+    # [end_date - 45 дней; end_date]
+    celestrak_file_url = "https://celestrak.com/SpaceData/SW-Last5Years.txt"
+
+    # отсюда берём индекс MG2, который будем переводить в XM10, для диапазона дат:
+    # [end_date - 45 дней; end_date]
+    iup_mgii_url = "http://www.iup.uni-bremen.de/UVSAT/../gome/solar/GOME2B_Index_classic.dat"
+
+    # если папка не задана, то работаем во временной папке - она удалится вместе с файлами,
+    # а одновременные вызовы с разными csv_name не будут мешать друг другу
+    if data_dir is None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            parse_all_files(celestrak_file_url, iup_mgii_url, url_flux, url_magnit, tmp_dir)
+            make_csv_for_JB2006(start_date, end_date, tmp_dir, csv_name)
+        return
+
+    # записываем все данные в файлы (неизменившиеся с прошлого запуска файлы не скачиваются)
+    parse_all_files(celestrak_file_url, iup_mgii_url, url_flux, url_magnit, data_dir)
+
+    # делаем наш файл
+    make_csv_for_JB2006(start_date, end_date, data_dir, csv_name)